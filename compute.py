@@ -0,0 +1,67 @@
+"""
+Thread Simulator - Compute Kernels
+This module provides the CPU-bound workloads run by simulated threads, compiled with numba when available.
+"""
+
+import math
+import os
+from contextlib import contextmanager
+
+# Import logger for detailed error tracking
+from logger import log_info, log_debug
+
+# Try to import numba so kernels run as native code without holding the GIL
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    log_info("numba package is available, compute kernels will be compiled")
+except ImportError:
+    NUMBA_AVAILABLE = False
+    log_info("numba package not available, compute kernels will run in the interpreter")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Whether OS threads can be pinned to a CPU core (Linux only)
+AFFINITY_AVAILABLE = hasattr(os, "sched_setaffinity")
+
+# CPUs the process may run on, read once so a pinned thread does not narrow later choices
+PROCESS_CPUS = sorted(os.sched_getaffinity(0)) if AFFINITY_AVAILABLE else []
+
+# Iterations of work performed per progress step in compute mode
+COMPUTE_STEP_ITERATIONS = 1_000_000
+
+# Compilation flags shared by all kernels
+FAST = dict(cache=True, fastmath=True, boundscheck=False, nogil=True)
+
+@njit(**FAST)
+def tick(n, seed):
+    """Perform n iterations of floating point work seeded by the thread id"""
+    s = 0.0
+    for i in range(n):
+        s += math.sin(i + seed)
+    return s
+
+@contextmanager
+def pinned_to_core(slot):
+    """Pin the calling OS thread to one of the process's CPU cores, chosen by slot, and restore its mask on exit"""
+    if not AFFINITY_AVAILABLE:
+        yield
+        return
+    try:
+        saved = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {PROCESS_CPUS[slot % len(PROCESS_CPUS)]})
+    except OSError as e:
+        log_debug("Could not set thread affinity: %s", e)
+        yield
+        return
+    try:
+        yield
+    finally:
+        try:
+            os.sched_setaffinity(0, saved)
+        except OSError as e:
+            log_debug("Could not restore thread affinity: %s", e)
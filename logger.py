@@ -19,7 +19,8 @@ log_format = '%(asctime)s - %(levelname)s - %(module)s - %(message)s'
 
 # Create and configure logger
 logger = logging.getLogger('thread_simulator')
-logger.setLevel(logging.DEBUG)
+# Debug records stay off worker paths by default; set logging.DEBUG here to trace them
+logger.setLevel(logging.INFO)
 
 # File handler
 file_handler = logging.FileHandler(log_file)
@@ -42,18 +43,19 @@ def log_exception(e, additional_info=""):
     logger.error(traceback.format_exc())
     return error_message
 
-def log_debug(message):
-    """Log a debug message."""
-    logger.debug(message)
+def log_debug(message, *args):
+    """Log a debug message; extra args are %-formatted lazily, only if debug logging is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args)
 
-def log_info(message):
+def log_info(message, *args):
     """Log an info message."""
-    logger.info(message)
+    logger.info(message, *args)
 
-def log_warning(message):
+def log_warning(message, *args):
     """Log a warning message."""
-    logger.warning(message)
+    logger.warning(message, *args)
 
-def log_error(message):
+def log_error(message, *args):
     """Log an error message."""
-    logger.error(message)
+    logger.error(message, *args)
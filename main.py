@@ -30,7 +30,7 @@ except ImportError:
 try:
     import matplotlib
     log_info(f"Using matplotlib version {matplotlib.__version__}")
-    matplotlib.use('TkAgg')
+    matplotlib.use('TkAgg', force=True)
     log_info("Set matplotlib backend to TkAgg")
 except Exception as e:
     log_exception(e, "Failed to configure matplotlib backend")
@@ -4,10 +4,15 @@ This module contains the core models for the thread simulator including Thread,
 """
 
 import time
+import array
+import atexit
 import threading
 import enum
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Callable, Any
 
+import numpy as np
+
 # Thread States
 class ThreadState(enum.Enum):
     NEW = "New"
@@ -15,6 +20,23 @@ class ThreadState(enum.Enum):
     RUNNING = "Running"
     BLOCKED = "Blocked"
     TERMINATED = "Terminated"
+    
+    @property
+    def value_id(self):
+        """Integer code used when states are stored in NumPy arrays"""
+        return _STATE_IDS[self]
+
+# Integer code of each state; fixed here so reordering the members cannot change stored codes
+_STATE_IDS = {
+    ThreadState.NEW: 0,
+    ThreadState.READY: 1,
+    ThreadState.RUNNING: 2,
+    ThreadState.BLOCKED: 3,
+    ThreadState.TERMINATED: 4
+}
+
+# Lookup from integer state code back to ThreadState
+STATE_BY_ID = tuple(sorted(_STATE_IDS, key=_STATE_IDS.get))
 
 # Thread Model Types
 class ThreadModelType(enum.Enum):
@@ -23,15 +45,49 @@ class ThreadModelType(enum.Enum):
     MANY_TO_MANY = "Many-to-Many"
     ONE_TO_ONE = "One-to-One"
 
+class ThreadTable:
+    """Struct-of-arrays storage for the state and progress of many threads, indexed by slot"""
+    
+    def __init__(self, capacity=16):
+        self.states = np.zeros(max(1, capacity), dtype=np.int8)
+        self.progress = np.zeros(max(1, capacity), dtype=np.float32)
+        self.count = 0
+        self.lock = threading.Lock()
+        
+    def allocate(self):
+        """Reserve a slot for a new thread and return its index"""
+        with self.lock:
+            if self.count == len(self.states):
+                # Grow by doubling; threads keep a reference to the table, not the arrays
+                states = np.zeros(len(self.states) * 2, dtype=np.int8)
+                states[:self.count] = self.states[:self.count]
+                progress = np.zeros(len(self.progress) * 2, dtype=np.float32)
+                progress[:self.count] = self.progress[:self.count]
+                self.states = states
+                self.progress = progress
+            slot = self.count
+            self.count += 1
+            return slot
+        
+    def state_ids(self):
+        """Return the state codes of all allocated slots"""
+        return self.states[:self.count]
+    
+    def progress_values(self):
+        """Return the progress of all allocated slots"""
+        return self.progress[:self.count]
+
 class Thread:
     """Represents a user thread in the system"""
     
     next_id = 1
     
-    def __init__(self, name=None, function=None, args=None):
+    def __init__(self, name=None, function=None, args=None, table=None):
         self.id = Thread.next_id
         Thread.next_id += 1
         self.name = name or f"Thread-{self.id}"
+        self.table = table if table is not None else ThreadTable(capacity=1)
+        self.slot = self.table.allocate()
         self.state = ThreadState.NEW
         self.function = function or self._default_function
         self.args = args or []
@@ -39,13 +95,34 @@ class Thread:
         self.start_time = None
         self.end_time = None
         self.kernel_thread = None
-        self.progress = 0  # Progress from 0-100%
+        self.progress = 0  # Progress from 0-100%, stored in the thread table
         self.blocked_by = None  # Reference to blocking resource
-        self.history = []  # Track state transitions
+        # Track state transitions as parallel columns of timestamps and state codes
+        self.history_times = array.array('d')
+        self.history_states = array.array('b')
         
         # Add initial state to history
         self.add_to_history(self.state)
     
+    @property
+    def state(self):
+        """Current state of the thread"""
+        return self._state
+    
+    @state.setter
+    def state(self, state):
+        self._state = state
+        self.table.states[self.slot] = state.value_id
+    
+    @property
+    def progress(self):
+        """Progress of the thread from 0-100%"""
+        return float(self.table.progress[self.slot])
+    
+    @progress.setter
+    def progress(self, progress):
+        self.table.progress[self.slot] = progress
+    
     def _default_function(self, *args):
         """Default function that simulates work by sleeping"""
         for i in range(10):
@@ -91,10 +168,21 @@ class Thread:
         
     def add_to_history(self, state):
         """Add state transition to history"""
-        self.history.append({
-            'state': state,
-            'time': time.time()
-        })
+        # Record transitions only; a repeated state would just extend the current run
+        states = self.history_states
+        if states and states[-1] == state.value_id:
+            return
+        # Time first: readers trim both columns to the shorter one
+        self.history_times.append(time.time())
+        self.history_states.append(state.value_id)
+    
+    def history_snapshot(self):
+        """Return copies of the history columns as equal-length (times, state codes) arrays"""
+        # Slicing copies, so worker threads can keep appending while the copies are in use
+        times = np.frombuffer(self.history_times[:], dtype=np.float64)
+        states = np.frombuffer(self.history_states[:], dtype=np.int8)
+        n = min(len(times), len(states))
+        return times[:n], states[:n]
 
 class Process:
     """Represents a process with multiple threads"""
@@ -163,6 +251,11 @@ class OneToManyModel(ThreadingModel):
         
     def run_simulation(self, callback=None):
         """Simulate the One-to-Many model"""
+        def kernel_thread_func(user_thread):
+            user_thread.run()
+            if callback:
+                callback()
+        
         for process in self.processes:
             process.kernel_threads = []
             
@@ -170,11 +263,6 @@ class OneToManyModel(ThreadingModel):
             for thread in process.threads:
                 thread.start()
                 
-                def kernel_thread_func(user_thread):
-                    user_thread.run()
-                    if callback:
-                        callback()
-                
                 # Create and start kernel thread for this user thread
                 kernel_thread = threading.Thread(
                     target=kernel_thread_func, 
@@ -184,6 +272,31 @@ class OneToManyModel(ThreadingModel):
                 thread.kernel_thread = kernel_thread
                 kernel_thread.start()
 
+# Persistent kernel thread pools shared by Many-to-Many simulations, one per kernel thread count
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+def _get_kernel_pool(kernel_thread_count):
+    """Return the shared pool with exactly kernel_thread_count workers, creating it on first use"""
+    size = max(1, kernel_thread_count)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(size)
+        if pool is None:
+            pool = _POOLS[size] = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sim")
+        return pool
+
+def shutdown_kernel_pools():
+    """Retire the shared pools so the next run creates fresh ones"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        # Leftover tasks still drain on the retired pool; they see the stopped simulation and return.
+        # Queued futures are not cancelled because cancelled futures never wake a pending wait()
+        pool.shutdown(wait=False)
+
+atexit.register(shutdown_kernel_pools)
+
 class ManyToManyModel(ThreadingModel):
     """Many user-level threads mapped to many kernel threads (thread pool)"""
     
@@ -193,22 +306,21 @@ class ManyToManyModel(ThreadingModel):
         
     def run_simulation(self, callback=None):
         """Simulate the Many-to-Many model"""
+        # Reuse the persistent pool instead of spawning kernel threads per run
+        executor = _get_kernel_pool(self.kernel_thread_count)
+        
+        def execute_thread(thread):
+            thread.start()
+            thread.run()
+            if callback:
+                callback()
+            return thread
+        
         for process in self.processes:
-            # Create a thread pool
-            from concurrent.futures import ThreadPoolExecutor
-            
-            def execute_thread(thread):
-                thread.start()
-                thread.run()
-                if callback:
-                    callback()
-                return thread
-            
-            # Create thread pool with kernel_thread_count threads
-            with ThreadPoolExecutor(max_workers=self.kernel_thread_count) as executor:
-                # Submit all user threads to the pool
-                futures = [executor.submit(execute_thread, thread) for thread in process.threads]
-                process.kernel_threads = [f for f in futures]  # Not actual threads but maintain the relationship
+            # Submit all user threads to the pool and wait for them to finish
+            futures = [executor.submit(execute_thread, thread) for thread in process.threads]
+            process.kernel_threads = [f for f in futures]  # Not actual threads but maintain the relationship
+            wait(futures)
 
 class OneToOneModel(ThreadingModel):
     """One user-level thread mapped to one kernel thread"""
@@ -218,6 +330,11 @@ class OneToOneModel(ThreadingModel):
         
     def run_simulation(self, callback=None):
         """Simulate the One-to-One model"""
+        def kernel_thread_func(user_thread):
+            user_thread.run()
+            if callback:
+                callback()
+        
         for process in self.processes:
             process.kernel_threads = []
             
@@ -225,11 +342,6 @@ class OneToOneModel(ThreadingModel):
             for thread in process.threads:
                 thread.start()
                 
-                def kernel_thread_func(user_thread):
-                    user_thread.run()
-                    if callback:
-                        callback()
-                
                 # Create and start kernel thread for this user thread
                 kernel_thread = threading.Thread(
                     target=kernel_thread_func, 
@@ -6,22 +6,48 @@ This module provides the core simulation logic that coordinates threads, process
 import time
 import threading
 import random
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, NamedTuple, Tuple
 import traceback
 from collections import deque
 
+import numpy as np
+
 # Import logger for detailed error tracking
 from logger import log_info, log_error, log_exception, log_debug
 
 # Import model classes with error handling
 try:
-    from models import Thread, Process, ThreadState, ThreadModelType
-    from models import ManyToOneModel, OneToManyModel, ManyToManyModel, OneToOneModel
+    from models import Thread, Process, ThreadState, ThreadModelType, ThreadTable, STATE_BY_ID
+    from models import ManyToOneModel, OneToManyModel, ManyToManyModel, OneToOneModel, shutdown_kernel_pools
     from synchronization import Semaphore, Monitor
 except Exception as e:
     log_exception(e, "Failed to import model classes")
     raise
 
+class SimulatorSnapshot(NamedTuple):
+    """Immutable copy of the simulator state taken once per UI tick"""
+    current_time: float
+    is_running: bool
+    names: Tuple[str, ...]
+    states: np.ndarray  # int8 ThreadState.value_id per thread
+    progress: np.ndarray  # float32 progress per thread
+    histories: Tuple[Tuple[np.ndarray, np.ndarray], ...]  # (times, state codes) per thread
+    sem_ids: Tuple[int, ...]  # id() of each semaphore, as passed to sync change callbacks
+    sem_names: Tuple[str, ...]
+    sem_values: np.ndarray  # Free permits per semaphore
+    sem_waiters: np.ndarray  # Blocked threads per semaphore
+    monitor_ids: Tuple[int, ...]
+    monitor_names: Tuple[str, ...]
+    monitor_waiters: np.ndarray  # Queued threads per monitor
+
+# Threading model implementation for each model type
+MODEL_CLASSES = {
+    ThreadModelType.MANY_TO_ONE: ManyToOneModel,
+    ThreadModelType.ONE_TO_MANY: OneToManyModel,
+    ThreadModelType.MANY_TO_MANY: ManyToManyModel,
+    ThreadModelType.ONE_TO_ONE: OneToOneModel
+}
+
 class ThreadSimulator:
     """Main simulator engine that manages the entire simulation"""
     
@@ -30,12 +56,14 @@ class ThreadSimulator:
         try:
             self.processes = []
             self.threads = []
+            self.thread_table = ThreadTable()  # Per-thread state codes indexed by slot
             self.semaphores = []
             self.monitors = []
             self.threading_model = None
             self.is_running = False
             self.is_paused = False
             self.update_callbacks = []  # Callbacks for UI updates
+            self.sync_change_callbacks = []  # Callbacks for semaphore/monitor changes
             self.simulation_speed = 1.0  # Speed multiplier
             self.current_time = 0
             self.simulation_thread = None
@@ -59,8 +87,9 @@ class ThreadSimulator:
         
     def create_thread(self, process, function=None, args=None, name=None) -> Thread:
         """Create a new thread and add it to a process"""
-        thread = Thread(name, function, args)
-        self.threads.append(thread)
+        with self.lock:
+            thread = Thread(name, function, args, table=self.thread_table)
+            self.threads.append(thread)
         process.add_thread(thread)
         
         # Initialize performance tracking for this thread
@@ -79,28 +108,30 @@ class ThreadSimulator:
         """Create a new semaphore"""
         semaphore = Semaphore(value, name or f"Semaphore-{len(self.semaphores)+1}")
         self.semaphores.append(semaphore)
+        semaphore.on_change = self._notify_sync_change
+        self._notify_sync_change(semaphore)
         return semaphore
     
     def create_monitor(self, name=None) -> Monitor:
         """Create a new monitor"""
         monitor = Monitor(name or f"Monitor-{len(self.monitors)+1}")
         self.monitors.append(monitor)
+        monitor.on_change = self._notify_sync_change
+        self._notify_sync_change(monitor)
         return monitor
     
     def set_threading_model(self, model_type: ThreadModelType, **kwargs):
         """Set the threading model for the simulation"""
-        if model_type == ThreadModelType.MANY_TO_ONE:
-            self.threading_model = ManyToOneModel()
-        elif model_type == ThreadModelType.ONE_TO_MANY:
-            self.threading_model = OneToManyModel()
-        elif model_type == ThreadModelType.MANY_TO_MANY:
+        model_class = MODEL_CLASSES.get(model_type)
+        if model_class is None:
+            raise ValueError(f"Unknown threading model type: {model_type}")
+        
+        if model_type == ThreadModelType.MANY_TO_MANY:
             # Get kernel thread count from kwargs or use default
             kernel_thread_count = kwargs.get('kernel_thread_count', 2)
-            self.threading_model = ManyToManyModel(kernel_thread_count)
-        elif model_type == ThreadModelType.ONE_TO_ONE:
-            self.threading_model = OneToOneModel()
+            self.threading_model = model_class(kernel_thread_count)
         else:
-            raise ValueError(f"Unknown threading model type: {model_type}")
+            self.threading_model = model_class()
         
         # Add all processes to the model
         for process in self.processes:
@@ -171,6 +202,18 @@ class ThreadSimulator:
         """Register a callback function to be called when simulation state changes"""
         self.update_callbacks.append(callback)
     
+    def register_sync_change_callback(self, callback: Callable):
+        """Register a callback function to be called with a semaphore or monitor whenever it changes"""
+        self.sync_change_callbacks.append(callback)
+    
+    def _notify_sync_change(self, primitive):
+        """Notify all registered callbacks that a synchronization primitive changed"""
+        for callback in self.sync_change_callbacks:
+            try:
+                callback(primitive)
+            except Exception as e:
+                log_exception(e, "Error in sync change callback")
+    
     def _notify_update(self):
         """Notify all registered callbacks about a state update"""
         for callback in self.update_callbacks:
@@ -290,6 +333,13 @@ class ThreadSimulator:
         self.is_running = False
         self.is_paused = False
         
+        # Wake threads blocked on a semaphore so they can exit
+        for semaphore in self.semaphores:
+            semaphore.cancel()
+        
+        # Retire the kernel pools so tasks left over from this run never occupy the next run's workers
+        shutdown_kernel_pools()
+        
         # Terminate all threads
         for thread in self.threads:
             if thread.state != ThreadState.TERMINATED:
@@ -324,10 +374,12 @@ class ThreadSimulator:
         self.stop_simulation()
         
         # Reset all collections
-        self.threads = []
+        with self.lock:
+            self.threads = []
+            self.thread_table = ThreadTable()
+            self.semaphores = []
+            self.monitors = []
         self.processes = []
-        self.semaphores = []
-        self.monitors = []
         self.threading_model = None
         self.current_time = 0
         self.thread_performance_data = {}
@@ -341,7 +393,40 @@ class ThreadSimulator:
     def set_simulation_speed(self, speed: float):
         """Set the simulation speed multiplier"""
         self.simulation_speed = max(0.1, min(10.0, speed))
-        log_debug(f"Set simulation speed to {self.simulation_speed}")
+        log_debug("Set simulation speed to %s", self.simulation_speed)
+    
+    def snapshot(self) -> SimulatorSnapshot:
+        """Take a consistent copy of the thread states, progress, histories and primitives"""
+        with self.lock:
+            threads = tuple(self.threads)
+            table = self.thread_table
+            count = len(threads)
+            semaphores = tuple(self.semaphores)
+            monitors = tuple(self.monitors)
+            
+            # Read each semaphore's count and waiters together under its own lock
+            sem_values = np.zeros(len(semaphores), dtype=np.int32)
+            sem_waiters = np.zeros(len(semaphores), dtype=np.int32)
+            for i, semaphore in enumerate(semaphores):
+                with semaphore.lock:
+                    sem_values[i] = semaphore.count
+                    sem_waiters[i] = len(semaphore.queue)
+            
+            return SimulatorSnapshot(
+                current_time=self.current_time,
+                is_running=self.is_running,
+                names=tuple(t.name for t in threads),
+                states=table.state_ids()[:count].copy(),
+                progress=table.progress_values()[:count].copy(),
+                histories=tuple(t.history_snapshot() for t in threads),
+                sem_ids=tuple(id(s) for s in semaphores),
+                sem_names=tuple(str(s.name) for s in semaphores),
+                sem_values=sem_values,
+                sem_waiters=sem_waiters,
+                monitor_ids=tuple(id(m) for m in monitors),
+                monitor_names=tuple(str(m.name) for m in monitors),
+                monitor_waiters=np.array([len(m.waiting_queue) for m in monitors], dtype=np.int32)
+            )
     
     def get_thread_efficiency(self, thread_id):
         """Calculate thread efficiency metrics"""
@@ -423,34 +508,25 @@ class ThreadSimulator:
             'resource_contentions': self.resource_contentions
         }
         
-        # Count threads by state
+        # Count threads by state in one pass over the state table
+        counts = np.bincount(self.thread_table.state_ids(), minlength=len(ThreadState))
         for state in ThreadState:
-            stats['thread_states'][state.name] = len([t for t in self.threads if t.state == state])
+            stats['thread_states'][state.name] = int(counts[state.value_id])
         
         # Collect semaphore info
         for semaphore in self.semaphores:
             stats['semaphores'].append({
                 'name': semaphore.name,
-                'value': semaphore.value,
-                'waiting_threads': len(semaphore.waiting_threads),
-                'log': semaphore.log[-10:] if semaphore.log else []  # Last 10 log entries
+                'value': semaphore.count,
+                'waiting_threads': len(semaphore.queue)
             })
         
         # Collect monitor info
         for monitor in self.monitors:
-            monitor_stats = {
+            stats['monitors'].append({
                 'name': monitor.name,
-                'log': monitor.log[-10:] if monitor.log else [],  # Last 10 log entries
-                'condition_vars': {}
-            }
-            
-            for name, cv in monitor.condition_vars.items():
-                monitor_stats['condition_vars'][name] = {
-                    'waiting_threads': len(cv.waiting_threads),
-                    'log': cv.log[-10:] if cv.log else []  # Last 10 log entries
-                }
-                
-            stats['monitors'].append(monitor_stats)
+                'waiting_threads': len(monitor.waiting_queue)
+            })
         
         return stats
     
@@ -472,7 +548,10 @@ class ThreadSimulator:
             'performance_stats': self.get_performance_stats(),
             'simulation_stats': self.get_simulation_stats(),
             'thread_histories': {
-                t.id: [{'state': h['state'].name, 'time': h['time']} for h in t.history] 
+                t.id: [
+                    {'state': STATE_BY_ID[state_id].name, 'time': float(when)}
+                    for when, state_id in zip(*t.history_snapshot())
+                ]
                 for t in self.threads
             }
         }
@@ -507,10 +586,10 @@ class ThreadSimulator:
                         log_error(f"Invalid thread_id: {thread_id}, max: {len(self.threads)-1}")
                         return
                     
-                    log_debug(f"Thread function started for thread_id: {thread_id}")
+                    log_debug("Thread function started for thread_id: %d", thread_id)
                     # Try to acquire the semaphore
-                    while not sem.wait(self.threads[thread_id]):
-                        time.sleep(0.1 / self.simulation_speed)
+                    if not sem.wait(self.threads[thread_id]):
+                        return  # Semaphore was cancelled because the simulation stopped
                     
                     # Critical section (simulate work)
                     for i in range(10):
@@ -521,7 +600,7 @@ class ThreadSimulator:
                     
                     # Release the semaphore
                     sem.signal(self.threads[thread_id])
-                    log_debug(f"Thread function completed for thread_id: {thread_id}")
+                    log_debug("Thread function completed for thread_id: %d", thread_id)
                 except Exception as e:
                     log_exception(e, f"Error in thread_function for thread_id: {thread_id}")
             
@@ -1,94 +1,183 @@
 import threading
-from utils import ThreadState
-import time
-import random
+from collections import deque
+from models import ThreadState
+from logger import log_debug
+
+# Seconds between checks of a blocked waiter's keep_waiting callback
+WAIT_POLL_INTERVAL = 0.5
+
+class _Waiter:
+    """A thread blocked on a Semaphore; signal() or cancel() settles granted and then sets event"""
+    __slots__ = ("thread", "event", "granted")
+
+    def __init__(self, thread):
+        self.thread = thread
+        self.event = threading.Event()
+        self.granted = False
+
 class Semaphore:
-    def __init__(self, count=1, queue=None):
+    # Messages are tuples: (type, sem_id, *payload)
+    #   ("semaphore_created", sem_id, count)
+    #   ("semaphore_wait", sem_id, success, thread_id)
+    #   ("semaphore_signal", sem_id, thread_id)
+    def __init__(self, count=1, name=None, queue=None):
+        self.name = name
         self.count = count
+        self.initial_count = count
         self.lock = threading.Lock()
-        self.queue = []
+        self.queue = deque()  # _Waiter entries in FIFO order
+        self.cancelled = False
+        self.on_change = None  # Called with the semaphore after its count or waiters change
         self.msg_queue = queue
+        # A deque sink is appended to directly (atomic under the GIL); anything else must provide put()
+        if queue is None:
+            self._post = None
+        elif isinstance(queue, deque):
+            self._post = queue.append
+        else:
+            self._post = queue.put
         self.sem_id = id(self)
-        if self.msg_queue:
-            self.msg_queue.put({
-                "type": "semaphore_created",
-                "sem_id": self.sem_id,
-                "count": self.count
-            })
+        self._wait_ok_tpl = ("semaphore_wait", self.sem_id, True)
+        self._wait_fail_tpl = ("semaphore_wait", self.sem_id, False)
+        self._signal_tpl = ("semaphore_signal", self.sem_id)
+        if self._post:
+            self._post(("semaphore_created", self.sem_id, self.count))
 
-    def wait(self, thread):
-        thread.set_state(ThreadState.READY)
-        time.sleep(1)
+    def wait(self, thread, keep_waiting=None):
+        """Acquire the semaphore, blocking until signal() hands over a permit.
+
+        Returns False if the semaphore is cancelled, or if keep_waiting is given and
+        returns False while the thread is blocked; it is checked every WAIT_POLL_INTERVAL seconds.
+        """
+        thread.state = ThreadState.READY
+        waiter = None
         with self.lock:
+            if self.cancelled:
+                return False
             if self.count > 0:
                 self.count -= 1
-                thread.set_state(ThreadState.RUNNING)
-                if self.msg_queue:
-                    self.msg_queue.put({
-                        "type": "semaphore_wait",
-                        "thread_id": thread.thread_id,
-                        "sem_id": self.sem_id,
-                        "success": True
-                    })
             else:
-                thread.set_state(ThreadState.BLOCKED)
-                self.queue.append(thread)
-                if self.msg_queue:
-                    self.msg_queue.put({
-                        "type": "semaphore_wait",
-                        "thread_id": thread.thread_id,
-                        "sem_id": self.sem_id,
-                        "success": False
-                    })
-
-    def signal(self):
+                thread.state = ThreadState.BLOCKED
+                waiter = _Waiter(thread)
+                self.queue.append(waiter)
+        if waiter is not None:
+            # Publish after releasing the lock so the queue's own mutex is never nested inside it
+            if self._post:
+                self._post((*self._wait_fail_tpl, thread.id))
+            if self.on_change:
+                self.on_change(self)
+            # signal() passes its permit directly to this waiter; only this thread is woken
+            timeout = WAIT_POLL_INTERVAL if keep_waiting else None
+            while not waiter.event.wait(timeout):
+                if not keep_waiting():
+                    with self.lock:
+                        # A permit handed over since the timeout is kept; otherwise leave the queue
+                        if not waiter.event.is_set():
+                            self.queue.remove(waiter)
+                            waiter.event.set()
+            if not waiter.granted:
+                if self.on_change:
+                    self.on_change(self)
+                return False
+        thread.state = ThreadState.RUNNING
+        if self._post:
+            self._post((*self._wait_ok_tpl, thread.id))
+        if self.on_change:
+            self.on_change(self)
+        return True
 
+    def signal(self, thread=None):
+        """Release a permit held by thread, handing it to the longest-waiting thread if there is one."""
         with self.lock:
             if self.queue:
-                thread = self.queue.pop(0)
-                thread.set_state(ThreadState.TERMINATED)
-                time.sleep(random.randint(0,2))
-                if self.msg_queue:
-                    self.msg_queue.put({
-                        "type": "semaphore_signal",
-                        "sem_id": self.sem_id,
-                        "thread_id": thread.thread_id
-                    })
+                waiter = self.queue.popleft()
+                waiter.granted = True
+                waiter.event.set()
+                thread_id = waiter.thread.id
             else:
                 self.count += 1
-                if self.msg_queue:
-                    self.msg_queue.put({
-                        "type": "semaphore_signal",
-                        "sem_id": self.sem_id,
-                        "thread_id": None
-                    })
+                thread_id = None
+        if self._post:
+            self._post((*self._signal_tpl, thread_id))
+        if self.on_change:
+            self.on_change(self)
+
+    def cancel(self):
+        """Wake every blocked waiter without a permit; their wait() returns False, as do later waits."""
+        with self.lock:
+            self.cancelled = True
+            self._release_waiters()
+        if self.on_change:
+            self.on_change(self)
+
+    def reset(self):
+        """Restore the initial count for a new run."""
+        with self.lock:
+            self.count = self.initial_count
+            self._release_waiters()
+            self.cancelled = False
+        if self.on_change:
+            self.on_change(self)
+
+    def _release_waiters(self):
+        """Wake all queued waiters as not granted; the caller must hold the lock."""
+        while self.queue:
+            self.queue.popleft().event.set()
                     
 
 class Monitor:
-    def __init__(self):
-        self.lock = threading.Lock()
+    def __init__(self, name=None):
+        self.name = name
+        # RLock so the condition can check that the calling thread is the one holding the monitor
+        self.lock = threading.RLock()
         self.condition = threading.Condition(self.lock)
-        self.waiting_queue = []
+        self.waiting_queue = deque()
+        self.on_change = None  # Called with the monitor after its waiters change
+
+    def __enter__(self):
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.lock.release()
+
+    def wait(self):
+        """Wait for a notification; raises RuntimeError unless the caller holds the monitor."""
+        self.condition.wait()
+
+    def notify(self):
+        """Wake all waiting threads; raises RuntimeError unless the caller holds the monitor."""
+        self.condition.notify_all()
 
     def enter(self, thread):
         thread.state = ThreadState.READY
-        time.sleep(1)
-        with self.lock:
+        with self:
             if thread.state == ThreadState.BLOCKED:
-                time.sleep(2)
                 self.waiting_queue.append(thread)
-                self.condition.wait()
+                self.wait()
             thread.state = ThreadState.RUNNING
             #thread.run_task()
-            print(f"Thread {thread.thread_id} is now RUNNING inside the monitor.")
+            log_debug("Thread %s is now RUNNING inside the monitor.", thread.id)
+        if self.on_change:
+            self.on_change(self)
+
+    def reset(self):
+        """Wake any waiting threads and forget the waiting queue for a new run."""
+        with self:
+            self.waiting_queue.clear()
+            self.condition.notify_all()
+        if self.on_change:
+            self.on_change(self)
 
     def exit(self,thread):
-        with self.lock:
+        with self:
             if self.waiting_queue:
-                next_thread = self.waiting_queue.pop(0)
+                next_thread = self.waiting_queue.popleft()
                 next_thread.state = ThreadState.BLOCKED
                 self.condition.notify()
-                print(f"Thread {thread.thread_id} is leaving the monitor.")
+                log_debug("Thread %s is leaving the monitor.", thread.id)
+        if self.on_change:
+            self.on_change(self)
         
 
 '''import threading
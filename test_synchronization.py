@@ -0,0 +1,100 @@
+"""
+Thread Simulator - Synchronization Tests
+Checks that semaphores and monitors report their changes through the simulator.
+"""
+
+import threading
+import unittest
+
+from simulator import ThreadSimulator
+
+
+class SyncChangeTest(unittest.TestCase):
+    def setUp(self):
+        self.simulator = ThreadSimulator()
+        self.process = self.simulator.create_process()
+        self.changed = set()
+        self.simulator.register_sync_change_callback(lambda primitive: self.changed.add(id(primitive)))
+
+    def test_wait_signal_marks_only_that_semaphore(self):
+        semaphore = self.simulator.create_semaphore(1)
+        other = self.simulator.create_semaphore(1)
+        monitor = self.simulator.create_monitor()
+        thread = self.simulator.create_thread(self.process)
+        self.changed.clear()  # Creating a primitive reports it once
+
+        self.assertTrue(semaphore.wait(thread))
+        semaphore.signal(thread)
+
+        self.assertEqual(self.changed, {id(semaphore)})
+        self.assertNotIn(id(other), self.changed)
+        self.assertNotIn(id(monitor), self.changed)
+        self.assertEqual(semaphore.count, 1)
+
+    def test_signal_hands_permit_to_blocked_thread(self):
+        semaphore = self.simulator.create_semaphore(1)
+        first = self.simulator.create_thread(self.process)
+        second = self.simulator.create_thread(self.process)
+        self.assertTrue(semaphore.wait(first))
+
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(semaphore.wait(second)))
+        waiter.start()
+        while not semaphore.queue:
+            waiter.join(0.01)
+        semaphore.signal(first)
+        waiter.join(5)
+
+        self.assertEqual(result, [True])
+        self.assertEqual(semaphore.count, 0)
+
+    def test_cancel_releases_blocked_thread_without_permit(self):
+        semaphore = self.simulator.create_semaphore(1)
+        first = self.simulator.create_thread(self.process)
+        second = self.simulator.create_thread(self.process)
+        self.assertTrue(semaphore.wait(first))
+
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(semaphore.wait(second)))
+        waiter.start()
+        while not semaphore.queue:
+            waiter.join(0.01)
+        semaphore.cancel()
+        semaphore.reset()
+        waiter.join(5)
+
+        self.assertEqual(result, [False])
+        self.assertEqual(semaphore.count, 1)
+
+    def test_wait_gives_up_when_keep_waiting_turns_false(self):
+        semaphore = self.simulator.create_semaphore(1)
+        first = self.simulator.create_thread(self.process)
+        second = self.simulator.create_thread(self.process)
+        self.assertTrue(semaphore.wait(first))
+
+        running = threading.Event()
+        running.set()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(semaphore.wait(second, running.is_set)))
+        waiter.start()
+        while not semaphore.queue:
+            waiter.join(0.01)
+        running.clear()
+        waiter.join(5)
+
+        self.assertEqual(result, [False])
+        self.assertFalse(semaphore.queue)
+        semaphore.signal(first)
+        self.assertEqual(semaphore.count, 1)
+
+    def test_cancelled_semaphore_grants_no_permit(self):
+        semaphore = self.simulator.create_semaphore(1)
+        thread = self.simulator.create_thread(self.process)
+        semaphore.cancel()
+
+        self.assertFalse(semaphore.wait(thread))
+        self.assertEqual(semaphore.count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,17 +14,28 @@ from typing import Dict, List, Any, Tuple
 import sys
 import os
 
+import numpy as np
+
 # Import logger for detailed error tracking
 from logger import log_info, log_error, log_exception, log_debug
 
 # Import matplotlib with error handling
 try:
     log_debug("Importing matplotlib")
-    import matplotlib.pyplot as plt
+    import matplotlib
+    from matplotlib import style
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import matplotlib.animation as animation
     from matplotlib.figure import Figure
-    plt.style.use('ggplot')  # Modern style for plots
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba
+    style.use('ggplot')  # Modern style for plots
+    # Cheaper Agg rendering: simplify dense paths and rasterize long ones in chunks
+    matplotlib.rcParams.update({
+        'figure.autolayout': False,
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+    })
     log_info("Matplotlib imported successfully")
 except Exception as e:
     log_exception(e, "Failed to import matplotlib modules")
@@ -33,9 +44,10 @@ except Exception as e:
 # Import simulator modules with error handling
 try:
     log_debug("Importing simulator modules")
-    from models import Thread, Process, ThreadState, ThreadModelType
+    from models import Thread, Process, ThreadState, ThreadModelType, STATE_BY_ID
     from synchronization import Semaphore, Monitor
     from simulator import ThreadSimulator
+    from compute import tick, pinned_to_core, COMPUTE_STEP_ITERATIONS
     log_info("Simulator modules imported successfully")
 except Exception as e:
     log_exception(e, "Failed to import simulator modules")
@@ -50,6 +62,10 @@ except ImportError:
     THEMED_TK_AVAILABLE = False
     log_info("ttkthemes package not available, using standard ttk styling")
 
+def _state_color_lut(chart_colors):
+    """Build an RGBA array indexed by ThreadState.value_id from a state-to-color mapping"""
+    return np.array([to_rgba(chart_colors[state]) for state in STATE_BY_ID], dtype=np.float32)
+
 class ThreadSimulatorUI:
     """Main UI class for the Thread Simulator"""
     
@@ -86,6 +102,20 @@ class ThreadSimulatorUI:
         }
     }
     
+    # RGBA colors indexed by ThreadState.value_id, built once per theme
+    LIGHT_THEME["chart_color_lut"] = _state_color_lut(LIGHT_THEME["chart_colors"])
+    DARK_THEME["chart_color_lut"] = _state_color_lut(DARK_THEME["chart_colors"])
+    
+    # Bar label text and color indexed by ThreadState.value_id
+    STATE_LABEL_TEXTS = tuple(state.value for state in STATE_BY_ID)
+    STATE_LABEL_COLORS = tuple('white' if state == ThreadState.TERMINATED else 'black' for state in STATE_BY_ID)
+    
+    # Threading model for each dropdown label
+    MODEL_TYPES = {model_type.value: model_type for model_type in ThreadModelType}
+    
+    # Most threads a simulation can be configured with; thread bars are preallocated for this many
+    MAX_THREADS = 20
+    
     def __init__(self, root):
         self.root = root
         log_info("Initializing ThreadSimulatorUI")
@@ -98,10 +128,16 @@ class ThreadSimulatorUI:
             log_debug("Creating ThreadSimulator instance")
             self.simulator = ThreadSimulator()
             self.simulator.register_update_callback(self.safe_update_ui)
+            self._dirty_syncs = set()  # id() of primitives changed since the last snapshot
+            self._sync_pending = set()  # id() of changed primitives whose rows the sync tree has not rewritten yet
+            self.simulator.register_sync_change_callback(self._mark_sync_dirty)
             
             # Current theme
             self.current_theme = self.LIGHT_THEME
             self.update_needed = threading.Event()
+            self._refresh_pending = False  # Whether a visualization redraw is queued
+            self._var_values = {}  # Last value set on each Tk variable by _set_var
+            self._snapshot = self.simulator.snapshot()  # Replaced by update_ui on every tick
             # Set UI sizes
             log_debug("Setting window geometry")
             self.root.geometry("1200x800")
@@ -114,6 +150,8 @@ class ThreadSimulatorUI:
             log_debug("Creating main frame")
             self.main_frame = ttk.Frame(self.root)
             self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self._resize_job = None  # Pending after() id while the window is being resized
+            self.main_frame.bind("<Configure>", self._on_main_frame_configure)
             
             # Create UI components with detailed error handling
             log_debug("Creating control panel")
@@ -260,6 +298,21 @@ class ThreadSimulatorUI:
         )
         model_dropdown.pack(fill=tk.X, pady=2)
         
+        # Workload type
+        workload_frame = ttk.Frame(settings_frame)
+        workload_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(workload_frame, text="Workload:").pack(anchor=tk.W)
+        
+        self.workload_var = tk.StringVar(value="I/O-bound")
+        workload_dropdown = ttk.Combobox(
+            workload_frame,
+            textvariable=self.workload_var,
+            values=["I/O-bound", "CPU-bound"],
+            state="readonly"
+        )
+        workload_dropdown.pack(fill=tk.X, pady=2)
+        
         # Thread count
         thread_frame = ttk.Frame(settings_frame)
         thread_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -270,7 +323,7 @@ class ThreadSimulatorUI:
         thread_count_spinbox = ttk.Spinbox(
             thread_frame,
             from_=1,
-            to=20,
+            to=self.MAX_THREADS,
             textvariable=self.thread_count_var
         )
         thread_count_spinbox.pack(fill=tk.X, pady=2)
@@ -374,6 +427,7 @@ class ThreadSimulatorUI:
             # Create a notebook for multiple visualization tabs
             log_debug("Creating notebook for visualization tabs")
             self.notebook = ttk.Notebook(self.main_frame)
+            self.notebook.bind("<<NotebookTabChanged>>", lambda event: self._queue_refresh())
             self.notebook.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
             
             # Thread visualization tab
@@ -388,7 +442,6 @@ class ThreadSimulatorUI:
             # Matplotlib figure for thread visualization
             log_debug("Setting up matplotlib figure for thread visualization")
             try:
-                plt.rcParams['figure.dpi'] = 100
                 self.fig = Figure(figsize=(8, 6), dpi=100, facecolor=self.current_theme["bg"])
                 self.ax = self.fig.add_subplot(111)
                 self.ax.set_title('Thread States and Progress', color=self.current_theme["fg"])
@@ -411,6 +464,23 @@ class ThreadSimulatorUI:
                 self.canvas = FigureCanvasTkAgg(self.fig, master=self.thread_view_frame)
                 self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
                 
+                # Persistent bars and labels for the most threads allowed, blitted over a cached background
+                y_pos = range(self.MAX_THREADS)
+                self.bars = self.ax.barh(y_pos, [0] * self.MAX_THREADS, height=0.5, animated=True)
+                self.bar_labels = [
+                    self.ax.text(5, i, '', va='center', fontweight='bold', animated=True)
+                    for i in y_pos
+                ]
+                for bar, label in zip(self.bars, self.bar_labels):
+                    bar.set_visible(False)
+                    label.set_visible(False)
+                self.ax.set_ylim(-1, 1)  # barh autoscaled to every preallocated bar
+                self.ax.grid(True, linestyle='--', alpha=0.7)
+                self.bar_names = None
+                self.bar_signature = None
+                self.bar_background = None
+                self.canvas.mpl_connect('draw_event', self._on_thread_canvas_draw)
+                
                 # Create toolbar for thread visualization
                 from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
                 self.toolbar = NavigationToolbar2Tk(self.canvas, self.thread_view_frame)
@@ -429,7 +499,6 @@ class ThreadSimulatorUI:
             self.legend_frame.pack(fill=tk.X, padx=5, pady=5)
             
             legend_inner_frame = ttk.Frame(self.legend_frame)
-            legend_inner_frame.pack(fill=tk.X, padx=10, pady=10)
             
             state_colors = self.current_theme["chart_colors"]
             
@@ -437,11 +506,15 @@ class ThreadSimulatorUI:
                 frame = ttk.Frame(legend_inner_frame)
                 frame.grid(row=i//3, column=i%3, padx=15, pady=8, sticky="w")
                 
-                color_box = tk.Canvas(frame, width=18, height=18, bg=color, highlightthickness=0)
+                # A plain colored label; a Canvas would keep a display list for one rectangle
+                color_box = ttk.Label(frame, width=2, background=color)
                 color_box.pack(side=tk.LEFT, padx=5)
                 
                 ttk.Label(frame, text=state.value, font=("Helvetica", 10)).pack(side=tk.LEFT)
             
+            # Pack the legend once it is complete so its geometry is computed in one pass
+            legend_inner_frame.pack(fill=tk.X, padx=10, pady=10)
+            
             # Timeline visualization tab
             self.timeline_frame = ttk.Frame(self.notebook)
             self.notebook.add(self.timeline_frame, text="Timeline")
@@ -465,6 +538,11 @@ class ThreadSimulatorUI:
             self.timeline_canvas = FigureCanvasTkAgg(self.timeline_fig, master=self.timeline_frame)
             self.timeline_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
+            # Persistent segment collection and state labels, rebuilt when the threads change
+            self.timeline_lc = None
+            self.timeline_labels = []
+            self.timeline_names = None
+            
             # Create toolbar for timeline visualization
             self.timeline_toolbar = NavigationToolbar2Tk(self.timeline_canvas, self.timeline_frame)
             self.timeline_toolbar.update()
@@ -475,6 +553,7 @@ class ThreadSimulatorUI:
             
             # Create semaphore and monitor visualization
             self.sync_tree = ttk.Treeview(self.sync_frame)
+            self._sync_items = {}  # id(primitive) -> (tree iid, last text, last values)
             self.sync_tree["columns"] = ("type", "value", "waiting")
             self.sync_tree.heading("#0", text="Name")
             self.sync_tree.heading("type", text="Type")
@@ -646,7 +725,7 @@ class ThreadSimulatorUI:
             self.update_ui()
         except Exception as e:
             log_exception(e, "Error setting up initial UI state")
-            self.status_var.set(f"Error in initialization: {str(e)}")
+            self._set_var(self.status_var, f"Error in initialization: {str(e)}")
     
     def _set_light_theme(self):
         """Switch to light theme"""
@@ -671,6 +750,7 @@ class ThreadSimulatorUI:
         self.ax.spines['left'].set_color(self.current_theme["fg"])
         self.ax.tick_params(axis='x', colors=self.current_theme["fg"])
         self.ax.tick_params(axis='y', colors=self.current_theme["fg"])
+        self.bar_names = None  # Rebuild bars so tick labels pick up the new colors
         
         # Timeline plot
         self.timeline_fig.patch.set_facecolor(self.current_theme["bg"])
@@ -683,6 +763,7 @@ class ThreadSimulatorUI:
         self.timeline_ax.spines['left'].set_color(self.current_theme["fg"])
         self.timeline_ax.tick_params(axis='x', colors=self.current_theme["fg"])
         self.timeline_ax.tick_params(axis='y', colors=self.current_theme["fg"])
+        self.timeline_names = None  # Rebuild so tick labels and state labels pick up the new colors
         
         # Apply theme to performance charts
         self.perf_fig.patch.set_facecolor(self.current_theme["bg"])
@@ -698,8 +779,8 @@ class ThreadSimulatorUI:
         
         # Force redraw all canvases
         self.canvas.draw()
-        self.timeline_canvas.draw()
-        self.perf_canvas.draw()
+        self.timeline_canvas.draw_idle()
+        self.perf_canvas.draw_idle()
         
         # Update UI
         self.update_ui()
@@ -712,12 +793,18 @@ class ThreadSimulatorUI:
         # Redraw UI elements
         self.update_ui()
     def _start_ui_update_loop(self):
+        # Bound once; the callback below runs 10 times a second for the lifetime of the window
+        simulator = self.simulator
+        update_needed = self.update_needed
+        update_ui = self.update_ui
+        after = self.root.after
         def check_update():
-            #if self.update_needed.is_set():
-            self.update_ui()  # Perform update in main thread
-            self.update_needed.clear()  # Reset flag
-            self.root.after(100, check_update)  # Repeat every 100ms
-        self.root.after(100, check_update)  # Start the loop
+            # Only refresh while the simulation advances or after a simulator callback flagged a change
+            if simulator.is_running or update_needed.is_set():
+                update_needed.clear()  # Reset flag before updating so later changes are not lost
+                update_ui()  # Perform update in main thread
+            after(100, check_update)  # Repeat every 100ms
+        after(100, check_update)  # Start the loop
     '''
     def _start_ui_update_loop(self):
         """Start a loop to update the UI at regular intervals using Tkinter's after method"""
@@ -775,105 +862,214 @@ class ThreadSimulatorUI:
         except Exception as e:
             log_exception(e, "Error in safe_update_ui")
     
+    def _set_var(self, var, value):
+        """Set a Tk variable only if the value differs from the last one set through here"""
+        name = str(var)
+        if self._var_values.get(name) != value:
+            self._var_values[name] = value
+            var.set(value)
+    
+    def _mark_sync_dirty(self, primitive):
+        """Record that a semaphore or monitor changed; called from simulator worker threads"""
+        self._dirty_syncs.add(id(primitive))
+        self.update_needed.set()
+    
     def update_ui(self):
         """Update all UI components with current simulator state"""
         try:
+            sim = self.simulator
+            
             # Always update time display
-            if self.simulator.is_running:
-                self.simulator.current_time += 0.1
-                self.time_var.set(f"Time: {self.simulator.current_time:.2f}s")
+            if sim.is_running:
+                sim.current_time += 0.1
+                self._set_var(self.time_var, f"Time: {sim.current_time:.2f}s")
+            
+            # Collect change marks before the snapshot so every change they record is in it;
+            # pop one id at a time so marks added by worker threads meanwhile are kept for the next tick
+            while self._dirty_syncs:
+                self._sync_pending.add(self._dirty_syncs.pop())
+            
+            # Take one consistent snapshot; every visualization reads it instead of the live simulator
+            snap = sim.snapshot()
+            self._snapshot = snap
             
             # Check if we have threads to update thread-specific UI elements
-            if not self.simulator.threads:
-                self.status_var.set("Ready - No threads created")
+            if not snap.names:
+                self._set_var(self.status_var, "Ready - No threads created")
                 return
             
             # Update status
-            stats = self.simulator.get_simulation_stats()
-            states = stats['thread_states']
-            state_str = ", ".join([f"{state}: {count}" for state, count in states.items() if count > 0])
-            self.status_var.set(f"Threads: {sum(states.values())} ({state_str})")
+            counts = np.bincount(snap.states, minlength=len(ThreadState))
+            state_str = ", ".join([f"{state.name}: {counts[state.value_id]}" for state in ThreadState if counts[state.value_id] > 0])
+            self._set_var(self.status_var, f"Threads: {len(snap.names)} ({state_str})")
             
             # Use after methods to ensure UI operations happen in the main thread
-            self.root.after_idle(self._update_thread_visualization)
-            self.root.after_idle(self._update_timeline_visualization)
-            self.root.after_idle(self._update_sync_visualization)
-            self.root.after_idle(self._update_performance_visualization)
-            self.root.after_idle(self._update_button_states)
+            self._queue_refresh()
         except Exception as e:
             log_exception(e, "Error updating UI")
             # Use root.after to update UI from main thread
-            self.root.after_idle(lambda: self.status_var.set(f"Error: {str(e)}"))
+            self.root.after_idle(lambda: self._set_var(self.status_var, f"Error: {str(e)}"))
     
-    def _update_thread_visualization(self):
+    def _queue_refresh(self):
+        """Schedule one visualization refresh for the next idle pass unless one is already queued"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._refresh_visualizations)
+    
+    def _refresh_visualizations(self):
+        """Redraw the visible visualization in a single idle callback"""
+        self._refresh_pending = False
+        snap = self._snapshot
+        # Buttons are cheap and must follow Start/Pause even mid-resize
+        self._update_button_states(snap)
+        if self._resize_job is not None:
+            return  # Window is being resized; redraw the charts once it settles
+        
+        # Hidden tabs are refreshed when they are selected
+        visible = self.notebook.select()
+        if visible == str(self.thread_frame):
+            self._update_thread_visualization(snap)
+        elif visible == str(self.timeline_frame):
+            self._update_timeline_visualization(snap)
+        elif visible == str(self.sync_frame):
+            self._update_sync_visualization(snap)
+        elif visible == str(self.analytics_frame):
+            self._update_performance_visualization()
+    
+    def _on_main_frame_configure(self, event):
+        """Debounce window resizes so a drag produces one refresh after it stops"""
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(150, self._on_resize_settled)
+    
+    def _on_resize_settled(self):
+        """Refresh the visible tab once the window has stopped resizing"""
+        self._resize_job = None
+        self._queue_refresh()
+    
+    def _update_thread_visualization(self, snap):
         """Update the thread state visualization"""
-        # Clear the figure
-        self.ax.clear()
-        
-        # Get the threads and their states
-        threads = self.simulator.threads
-        if not threads:
+        thread_names, state_ids, progress = snap.names, snap.states, snap.progress
+        if not thread_names:
             return
         
-        # Colors for different thread states from current theme
-        state_colors = self.current_theme["chart_colors"]
+        # Skip the redraw entirely if no thread changed state or progress since the last one
+        if (thread_names == self.bar_names and self.bar_signature is not None
+                and np.array_equal(state_ids, self.bar_signature[0])
+                and np.array_equal(progress, self.bar_signature[1])):
+            return
+        self.bar_signature = (state_ids, progress)
         
-        # Create the thread state visualization
-        thread_names = [t.name for t in threads]
-        thread_states = [t.state for t in threads]
-        thread_progress = [t.progress for t in threads]
+        # Rebuild the static parts of the chart only when the set of threads changes
+        if thread_names != self.bar_names:
+            self._rebuild_thread_bars(thread_names)
         
-        # Plot thread progress bars
-        y_pos = range(len(threads))
-        bars = self.ax.barh(y_pos, thread_progress, height=0.5, 
-                         color=[state_colors[state] for state in thread_states])
+        # Colors for different thread states from current theme
+        color_lut = self.current_theme["chart_color_lut"]
+        
+        # Update the persistent bars and labels in place
+        label_texts = self.STATE_LABEL_TEXTS
+        label_colors = self.STATE_LABEL_COLORS
+        for bar, label, state_id, width in zip(self.bars, self.bar_labels, state_ids, progress):
+            bar.set_width(width)
+            bar.set_color(color_lut[state_id])
+            label.set_text(label_texts[state_id])
+            label.set_color(label_colors[state_id])
+        
+        # Blit only the bars and labels over the cached background
+        self._blit_thread_bars()
+    
+    def _rebuild_thread_bars(self, thread_names):
+        """Show one preallocated bar and label per thread and relabel the y axis"""
+        count = min(len(thread_names), self.MAX_THREADS)
+        for i, (bar, label) in enumerate(zip(self.bars, self.bar_labels)):
+            bar.set_visible(i < count)
+            label.set_visible(i < count)
+        self.bar_names = thread_names
+        
+        # Set labels with theme colors
+        self.ax.set_yticks(range(count))
+        self.ax.set_yticklabels(thread_names[:count], color=self.current_theme["fg"])
+        self.ax.set_ylim(-0.75, count - 0.25)
+        
+        # Full draw; the draw_event handler captures the new background
+        self.canvas.draw()
+    
+    def _on_thread_canvas_draw(self, event):
+        """Cache the thread chart background after every full draw and redraw the animated artists"""
+        self.bar_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+        for label in self.bar_labels:
+            self.ax.draw_artist(label)
+    
+    def _blit_thread_bars(self):
+        """Redraw only the animated thread bars and labels"""
+        if self.bar_background is None:
+            return
+        self.canvas.restore_region(self.bar_background)
+        for bar in self.bars:
+            self.ax.draw_artist(bar)
+        for label in self.bar_labels:
+            self.ax.draw_artist(label)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _update_timeline_visualization(self, snap):
+        """Update the thread timeline visualization"""
+        thread_names, histories = snap.names, snap.histories
+        if not thread_names:
+            return
         
-        # Set labels and titles with theme colors
-        self.ax.set_yticks(y_pos)
-        self.ax.set_yticklabels(thread_names, color=self.current_theme["fg"])
-        self.ax.set_xlabel('Progress (%)', color=self.current_theme["fg"])
-        self.ax.set_xlim(0, 100)
-        self.ax.set_title('Thread States and Progress', color=self.current_theme["fg"])
+        # Rebuild the axes only when the set of threads changes
+        if thread_names != self.timeline_names:
+            self._rebuild_timeline(thread_names)
         
-        # Style grid
-        self.ax.grid(True, linestyle='--', alpha=0.7)
+        # One segment per history entry: each state lasts until the next transition, the last one until now
+        segments = []
+        state_ids = []
+        for y, ((times, states), label) in enumerate(zip(histories, self.timeline_labels)):
+            if not len(times):
+                label.set_visible(False)
+                continue
+            
+            offsets = times - times[0]
+            now = max(offsets[-1], snap.current_time)
+            ends = np.append(offsets[1:], now)
+            thread_segments = np.empty((len(offsets), 2, 2))
+            thread_segments[:, 0, 0] = offsets
+            thread_segments[:, 1, 0] = ends
+            thread_segments[:, :, 1] = y
+            segments.append(thread_segments)
+            state_ids.append(states)
+            
+            # Add the current state as text label at the end of the line
+            last_state = STATE_BY_ID[states[-1]]
+            if last_state != ThreadState.TERMINATED:
+                label.set_position((now + 0.1, y))
+                label.set_text(last_state.value)
+                label.set_visible(True)
+            else:
+                label.set_visible(False)
+        
+        if segments:
+            segments = np.concatenate(segments)
+            colors = self.current_theme["chart_color_lut"][np.concatenate(state_ids)]
+        else:
+            colors = np.empty((0, 4))
         
-        # Style axes
-        self.ax.set_facecolor(self.current_theme["bg"])
-        self.ax.spines['bottom'].set_color(self.current_theme["fg"])
-        self.ax.spines['top'].set_color(self.current_theme["fg"])
-        self.ax.spines['right'].set_color(self.current_theme["fg"])
-        self.ax.spines['left'].set_color(self.current_theme["fg"])
-        self.ax.tick_params(axis='x', colors=self.current_theme["fg"])
-        self.ax.tick_params(axis='y', colors=self.current_theme["fg"])
+        self.timeline_lc.set_segments(segments)
+        self.timeline_lc.set_color(colors)
         
-        # Add state labels to the bars
-        for i, (bar, state) in enumerate(zip(bars, thread_states)):
-            label_color = 'white' if state == ThreadState.TERMINATED else 'black'
-            self.ax.text(
-                5, i, 
-                state.value, 
-                va='center', 
-                color=label_color,
-                fontweight='bold'
-            )
+        # Adjust axes limits
+        self.timeline_ax.set_xlim(0, max(0.1, snap.current_time + 1))
         
-        # Draw the canvas
-        self.canvas.draw()
+        # Queue a full draw; Tk coalesces it with any other pending draw
+        self.timeline_canvas.draw_idle()
     
-    def _update_timeline_visualization(self):
-        """Update the thread timeline visualization"""
-        # Clear the figure
+    def _rebuild_timeline(self, thread_names):
+        """Recreate the timeline axes, segment collection and state labels for a new set of threads"""
         self.timeline_ax.clear()
         
-        # Get the threads and their histories
-        threads = self.simulator.threads
-        if not threads:
-            return
-        
-        # Colors for different thread states from current theme
-        state_colors = self.current_theme["chart_colors"]
-        
         # Set background and text colors
         self.timeline_ax.set_facecolor(self.current_theme["bg"])
         self.timeline_ax.spines['bottom'].set_color(self.current_theme["fg"])
@@ -881,58 +1077,19 @@ class ThreadSimulatorUI:
         self.timeline_ax.spines['right'].set_color(self.current_theme["fg"])
         self.timeline_ax.spines['left'].set_color(self.current_theme["fg"])
         
-        # Plot timeline for each thread
-        thread_names = [t.name for t in threads]
-        
-        # Y-position for each thread
-        y_positions = {thread.name: i for i, thread in enumerate(threads)}
-        
-        # Plot state transitions for each thread
-        for thread in threads:
-            history = thread.history
-            if not history:
-                continue
-            
-            for i in range(len(history) - 1):
-                start_time = history[i]['time'] - history[0]['time']
-                end_time = history[i + 1]['time'] - history[0]['time']
-                state = history[i]['state']
-                
-                self.timeline_ax.plot(
-                    [start_time, end_time],
-                    [y_positions[thread.name], y_positions[thread.name]],
-                    color=state_colors[state],
-                    linewidth=10,
-                    solid_capstyle='butt'
-                )
-            
-            # Plot current state until now
-            if len(history) > 0:
-                last_time = history[-1]['time'] - history[0]['time']
-                now = max(last_time, self.simulator.current_time)
-                
-                self.timeline_ax.plot(
-                    [last_time, now],
-                    [y_positions[thread.name], y_positions[thread.name]],
-                    color=state_colors[history[-1]['state']],
-                    linewidth=10,
-                    solid_capstyle='butt'
-                )
-                
-                # Add the current state as text label at the end of the line
-                if history[-1]['state'] != ThreadState.TERMINATED:
-                    self.timeline_ax.text(
-                        now + 0.1, 
-                        y_positions[thread.name], 
-                        history[-1]['state'].value,
-                        color=self.current_theme["fg"],
-                        va='center',
-                        fontsize=8
-                    )
+        # All state segments of all threads are drawn by a single collection
+        self.timeline_lc = LineCollection([], linewidths=10, capstyle='butt')
+        self.timeline_ax.add_collection(self.timeline_lc)
+        self.timeline_labels = [
+            self.timeline_ax.text(0, i, '', color=self.current_theme["fg"], va='center', fontsize=8)
+            for i in range(len(thread_names))
+        ]
+        self.timeline_names = thread_names
         
         # Set labels and titles with theme colors
-        self.timeline_ax.set_yticks(range(len(threads)))
+        self.timeline_ax.set_yticks(range(len(thread_names)))
         self.timeline_ax.set_yticklabels(thread_names, color=self.current_theme["fg"])
+        self.timeline_ax.set_ylim(-1, len(thread_names))
         self.timeline_ax.set_xlabel('Time (s)', color=self.current_theme["fg"])
         self.timeline_ax.set_title('Thread Timeline', color=self.current_theme["fg"])
         self.timeline_ax.tick_params(axis='x', colors=self.current_theme["fg"])
@@ -940,58 +1097,41 @@ class ThreadSimulatorUI:
         
         # Add a grid
         self.timeline_ax.grid(True, linestyle='--', alpha=0.3)
-        
-        # Adjust axes limits
-        self.timeline_ax.set_xlim(0, max(0.1, self.simulator.current_time + 1))
-        
-        # Draw the canvas
-        self.timeline_canvas.draw()
     
-    def _update_sync_visualization(self):
+    def _update_sync_visualization(self, snap):
         """Update the synchronization primitives visualization"""
         try:
-            # Clear the tree
-            for item in self.sync_tree.get_children():
-                self.sync_tree.delete(item)
+            dirty = self._sync_pending
+            seen = set()
             
-            # Add semaphores
-            for semaphore in self.simulator.semaphores:
-                try:
-                    waiting_count = len(semaphore.waiting_threads) if hasattr(semaphore, 'waiting_threads') else 0
-                    self.sync_tree.insert(
-                        "", 
-                        "end",
-                        text=str(semaphore.name),
-                        values=("Semaphore", str(semaphore.value), str(waiting_count))
-                    )
-                except Exception as e:
-                    log_error(f"Error adding semaphore to tree: {e}")
+            # Add semaphores; rows of unchanged primitives are left as they are
+            for key, name, value, waiters in zip(snap.sem_ids, snap.sem_names, snap.sem_values, snap.sem_waiters):
+                self._set_sync_row(key, name, ("Semaphore", str(value), str(waiters)), dirty, seen)
             
             # Add monitors
-            for monitor in self.simulator.monitors:
-                try:
-                    monitor_id = self.sync_tree.insert(
-                        "", 
-                        "end",
-                        text=str(monitor.name),
-                        values=("Monitor", "", "")
-                    )
-                    
-                    # Add condition variables if they exist
-                    if hasattr(monitor, 'condition_vars'):
-                        for name, cv in monitor.condition_vars.items():
-                            waiting_count = len(cv.waiting_threads) if hasattr(cv, 'waiting_threads') else 0
-                            self.sync_tree.insert(
-                                monitor_id,
-                                "end",
-                                text=name,
-                                values=("Condition Variable", "", str(waiting_count))
-                            )
-                except Exception as e:
-                    log_error(f"Error adding monitor to tree: {e}")
+            for key, name, waiters in zip(snap.monitor_ids, snap.monitor_names, snap.monitor_waiters):
+                self._set_sync_row(key, name, ("Monitor", "", str(waiters)), dirty, seen)
+            
+            # Remove rows of primitives that no longer exist, e.g. after a reset
+            for key in [key for key in self._sync_items if key not in seen]:
+                iid, _, _ = self._sync_items.pop(key)
+                if self.sync_tree.exists(iid):
+                    self.sync_tree.delete(iid)
+            dirty.clear()
         except Exception as e:
             log_exception(e, f"Error updating sync visualization: {e}")
     
+    def _set_sync_row(self, key, text, values, dirty, seen):
+        """Insert the tree row for a primitive, or rewrite it if the primitive changed since last shown"""
+        seen.add(key)
+        entry = self._sync_items.get(key)
+        if entry is None:
+            self._sync_items[key] = (self.sync_tree.insert("", "end", text=text, values=values), text, values)
+        elif key in dirty and (text, values) != entry[1:]:
+            # A new primitive that reuses a freed id is reported as changed on creation, so the text is rewritten too
+            self.sync_tree.item(entry[0], text=text, values=values)
+            self._sync_items[key] = (entry[0], text, values)
+    
     def _update_performance_visualization(self):
         """Update the performance visualization"""
         try:
@@ -1016,9 +1156,9 @@ class ThreadSimulatorUI:
                 )
             
             # Update overall stats
-            self.context_switch_var.set(str(perf_stats['context_switches']))
-            self.contention_var.set(str(perf_stats['resource_contentions']))
-            self.cpu_util_var.set(f"{perf_stats['overall_cpu_utilization']:.1f}%")
+            self._set_var(self.context_switch_var, str(perf_stats['context_switches']))
+            self._set_var(self.contention_var, str(perf_stats['resource_contentions']))
+            self._set_var(self.cpu_util_var, f"{perf_stats['overall_cpu_utilization']:.1f}%")
             
             # Clear previous plots
             self.cpu_ax.clear()
@@ -1101,18 +1241,21 @@ class ThreadSimulatorUI:
                 ax.tick_params(axis='y', colors=self.current_theme["fg"])
                 ax.grid(True, linestyle='--', alpha=0.3)
             
-            # Redraw
-            self.perf_canvas.draw()
+            # Redraw on the next idle pass
+            self.perf_canvas.draw_idle()
             
         except Exception as e:
             log_exception(e, "Error updating performance visualization")
     
-    def _update_button_states(self):
+    def _update_button_states(self, snap):
         """Update the state of control buttons based on the simulator state"""
-        if self.simulator.is_running:
-            self.start_button.config(text="Pause", command=self._on_pause_simulation)
-            self.stop_button.config(state=tk.NORMAL)
-        else:
+        # Reconfigure only on a change; config(command=...) registers a new Tcl command every call
+        if snap.is_running:
+            if self.start_button.cget("text") != "Pause":
+                self.start_button.config(text="Pause", command=self._on_pause_simulation)
+            if str(self.stop_button.cget("state")) != tk.NORMAL:
+                self.stop_button.config(state=tk.NORMAL)
+        elif self.start_button.cget("text") != "Start":
             self.start_button.config(text="Start", command=self._on_start_simulation)
     
     def _on_start_simulation(self):
@@ -1120,17 +1263,11 @@ class ThreadSimulatorUI:
         if not self.simulator.is_running:
             # If simulation is not running, set up a new one
             model_type_str = self.model_var.get()
-            model_map = {
-                "Many-to-One": ThreadModelType.MANY_TO_ONE,
-                "One-to-Many": ThreadModelType.ONE_TO_MANY,
-                "Many-to-Many": ThreadModelType.MANY_TO_MANY,
-                "One-to-One": ThreadModelType.ONE_TO_ONE
-            }
-            
-            model_type = model_map.get(model_type_str, ThreadModelType.MANY_TO_ONE)
+            model_type = self.MODEL_TYPES.get(model_type_str, ThreadModelType.MANY_TO_ONE)
             thread_count = self.thread_count_var.get()
             semaphore_value = self.semaphore_value_var.get()
             kernel_thread_count = self.kernel_thread_count_var.get()
+            compute_mode = self.workload_var.get() == "CPU-bound"
             
             # Reset simulator
             self.simulator.reset_simulation()
@@ -1141,19 +1278,31 @@ class ThreadSimulatorUI:
             # Create semaphore
             semaphore = self.simulator.create_semaphore(semaphore_value, "Resource Semaphore")
             
+            # Blocked workers give up once the simulation is no longer running
+            def keep_waiting():
+                return self.simulator.is_running
+            
             # Define thread function with semaphore usage
             def thread_function(thread_id, sem):
-                while not sem.wait(self.simulator.threads[thread_id]):
-                    if not self.simulator.is_running:
-                        return  # Exit if simulation stops
-                    time.sleep(0.1 / self.simulator.simulation_speed)
-                 # Critical section
-                for i in range(10):
-                    if not self.simulator.is_running:
-                        return  # Exit if simulation stops
-                    time.sleep(0.2 / self.simulator.simulation_speed)
-                    self.simulator.threads[thread_id].progress = (i + 1) * 10
-                sem.signal(self.simulator.threads[thread_id])
+                thread = self.simulator.threads[thread_id]
+                if not sem.wait(thread, keep_waiting):
+                    return  # Simulation stopped or paused while waiting
+                try:
+                    # Critical section
+                    for i in range(10):
+                        if not self.simulator.is_running:
+                            return  # Exit if simulation stops
+                        if compute_mode:
+                            # Compiled kernel releases the GIL so workers can run on separate cores;
+                            # the pin keeps its cache warm and is lifted before the pool thread is reused
+                            with pinned_to_core(thread_id):
+                                tick(int(COMPUTE_STEP_ITERATIONS / self.simulator.simulation_speed), thread_id)
+                        else:
+                            time.sleep(0.2 / self.simulator.simulation_speed)
+                        thread.progress = (i + 1) * 10
+                finally:
+                    # Hand the permit on even when leaving early so no waiter is stranded
+                    sem.signal(thread)
             
             # Create threads
             for i in range(thread_count):
@@ -1204,6 +1353,7 @@ class ThreadSimulatorUI:
         self.semaphore_value_var.set(2)
         self.kernel_thread_count_var.set(3)
         self.model_var.set("Many-to-One")
+        self.workload_var.set("I/O-bound")
         self.speed_var.set(1.0)
         self.speed_label.config(text="1.0x")
         
@@ -1256,6 +1406,7 @@ Threading Models:
 - One-to-One: Each user thread mapped to exactly one kernel thread
 
 Controls:
+- Workload: I/O-bound threads sleep, CPU-bound threads run a compute kernel
 - Number of Threads: How many user threads to create
 - Semaphore Value: Initial value of the semaphore (max concurrent access)
 - Kernel Threads: Number of kernel threads for Many-to-Many model